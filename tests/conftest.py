@@ -211,6 +211,15 @@ except ImportError as e:
     jax_available = False
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--thorough",
+        action="store_true",
+        default=False,
+        help="run the tests marked as thorough, which repeat batched tests item by item",
+    )
+
+
 def pytest_collection_modifyitems(items, config):
     # python 3.4/3.5 compat: rootdir = pathlib.Path(str(config.rootdir))
     rootdir = pathlib.Path(config.rootdir)
@@ -236,6 +245,13 @@ def pytest_collection_modifyitems(items, config):
         ):
             item.add_marker(pytest.mark.core)
 
+    # Tests marked `thorough` only run when requested with the `--thorough` option
+    if not config.getoption("thorough"):
+        deselected = [item for item in items if item.get_closest_marker("thorough")]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if not item.get_closest_marker("thorough")]
+
 
 def pytest_runtest_setup(item):
     """Automatically skip tests if interfaces are not installed"""
@@ -1,3 +1,13 @@
+"""Unit tests for the purity measurement.
+
+The interface tests carry an ``xdist_group`` marker per interface. With
+``pytest -n 4 --dist=loadgroup tests/measurements/test_purity_measurement.py``
+all tests of one interface run serially on the same worker, so the module and
+class scoped caches below are filled once per interface. Different interfaces
+still run in parallel on separate workers.
+"""
+from functools import partial
+
 import pytest
 
 import numpy as np
@@ -5,34 +15,95 @@ import pennylane as qml
 
 
 def expected_purity_ising_xx(param):
-    """Returns the analytical purity for subsystems of the IsingXX"""
+    """Returns the analytical purity for subsystems of the IsingXX. Accepts an array of
+    parameters, in which case the purities are returned elementwise."""
 
-    eig_1 = (1 + np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-    eig_2 = (1 - np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-    return eig_1**2 + eig_2**2
+    # the reduced state has eigenvalues (1 +- sqrt(1 - 4 c^2 s^2)) / 2, whose squares
+    # sum to 1 - 2 c^2 s^2
+    cs = np.cos(param * 0.5) * np.sin(param * 0.5)
+    return 1 - 2 * cs * cs
 
 
 def expected_purity_grad_ising_xx(param):
-    """The analytic gradient purity for the IsingXX"""
-
-    eig_1 = (1 + np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-    eig_2 = (1 - np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-    grad_expected_purity = (
-        2
-        * eig_1
-        * (np.sin(param / 2) ** 3 * np.cos(param / 2) - np.sin(param / 2) * np.cos(param / 2) ** 3)
-        / np.sqrt(1 - 4 * np.sin(param / 2) ** 2 * np.cos(param / 2) ** 2)
-    ) + (
-        2
-        * eig_2
-        * (
-            np.sin(param / 2)
-            * np.cos(param / 2)
-            * (np.cos(param / 2) ** 2 - np.sin(param / 2) ** 2)
-        )
-        / np.sqrt(1 - 4 * np.sin(param / 2) ** 2 * np.cos(param / 2) ** 2)
-    )
-    return grad_expected_purity
+    """The analytic gradient purity for the IsingXX. Accepts an array of parameters, in
+    which case the gradients are returned elementwise."""
+
+    c = np.cos(param * 0.5)
+    s = np.sin(param * 0.5)
+    return 2 * c * s * (s * s - c * c)
+
+
+def bit_flip_circuit(p, wires):
+    """Prepares a Bell state with bit flips of probability ``p`` on both qubits and
+    returns the purity of the subsystem ``wires``"""
+    qml.Hadamard(wires=0)
+    qml.CNOT(wires=[0, 1])
+    qml.BitFlip(p, wires=0)
+    qml.BitFlip(p, wires=1)
+    return qml.purity(wires=wires)
+
+
+@pytest.fixture(scope="module")
+def device_cache():
+    """Devices shared by the tests of this module, keyed by name, wires and shots."""
+    return {}
+
+
+def get_device(cache, name, wires, shots=None):
+    """Returns a freshly reset device from the cache, creating it on first use."""
+    key = (name, wires if isinstance(wires, int) else tuple(wires), shots)
+    dev = cache.get(key)
+
+    if dev is None:
+        dev = qml.device(name, wires=wires, shots=shots)
+        cache[key] = dev
+
+    dev.reset()
+    return dev
+
+
+@pytest.fixture
+def new_return_mode():
+    """Enables the new return types for the duration of a test."""
+    qml.enable_return()
+    yield
+    qml.disable_return()
+
+
+@pytest.fixture(scope="module")
+def tf_param():
+    """A single TensorFlow variable, assigned the parameter value of each test."""
+    import tensorflow as tf
+
+    return tf.Variable(0.0, dtype=tf.float64)
+
+
+@pytest.fixture(scope="module")
+def torch_param():
+    """A single trainable Torch tensor, filled with the parameter value of each test."""
+    import torch
+
+    return torch.tensor(0.0, dtype=torch.float64, requires_grad=True)
+
+
+@pytest.fixture(scope="module")
+def jnp_params():
+    """The parameters of ``TestPurity`` as a JAX array, built once for all JAX tests."""
+    import jax.numpy as jnp
+
+    return jnp.asarray(TestPurity.parameters)
+
+
+@pytest.fixture(scope="class")
+def jax_grad_fn_cache():
+    """Purity gradient functions shared across the parameter values of a test."""
+    return {}
+
+
+@pytest.fixture(scope="class")
+def jit_circuit_cache():
+    """Jitted purity circuits shared across the parameter values of a test."""
+    return {}
 
 
 class TestPurity:
@@ -42,36 +113,84 @@ class TestPurity:
     grad_supported_devices = ["default.qubit", "default.mixed"]
     mix_supported_devices = ["default.mixed"]
 
-    diff_methods = ["backprop", "finite-diff"]
-
-    parameters = np.linspace(0, 2 * np.pi, 3)
-    probs = np.array([0.001, 0.01, 0.1, 0.2])
+    # finite-diff exercises the same purity code paths as backprop at a much higher cost,
+    # hence it only runs with the ``--thorough`` option
+    fast_diff_methods = ["backprop"]
+    diff_methods = fast_diff_methods + [pytest.param("finite-diff", marks=pytest.mark.thorough)]
+
+    parameters = (0.0, np.pi, 2 * np.pi)
+    parameter_ids = ["0", "pi", "2pi"]
+    parameter_indices = list(range(len(parameters)))
+    probs = (0.001, 0.01, 0.1, 0.2)
+    prob_ids = ["0.001", "0.01", "0.1", "0.2"]
+    bit_flip_purities = np.array(
+        [4 * (0.5 - (1 - p) * p) ** 2 + 4 * (1 - p) ** 2 * p**2 for p in probs]
+    )
 
     wires_list = [([0], True), ([1], True), ([0, 1], False)]
 
     @pytest.mark.parametrize("shots, shape", [(None, (1,)), (10, (1,)), ((1, 10), (2,))])
-    def test_shape(self, shots, shape):
+    def test_shape(self, shots, shape, device_cache):
         """Test the ``shape`` method."""
         meas = qml.purity(wires=0)
-        dev = qml.device("default.qubit", wires=1, shots=shots)
+        dev = get_device(device_cache, "default.qubit", 1, shots=shots)
         assert meas.shape(dev) == shape
 
     @pytest.mark.parametrize("shots, shape", [(None, ()), (10, ()), ((1, 10), ((), ()))])
-    def test_shape_new(self, shots, shape):
+    def test_shape_new(self, shots, shape, device_cache, new_return_mode):
         """Test the ``shape_new`` method."""
-        qml.enable_return()
         meas = qml.purity(wires=0)
-        dev = qml.device("default.qubit", wires=1, shots=shots)
+        dev = get_device(device_cache, "default.qubit", 1, shots=shots)
         assert meas.shape(dev) == shape
-        qml.disable_return()
 
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("param", parameters)
+    def test_IsingXX_qnode_purity_batched(self, device, device_cache):
+        """Tests purity for a qnode evaluated on all parameters at once using
+        parameter broadcasting, for all subsystems"""
+
+        dev = get_device(device_cache, device, 2)
+        params = np.asarray(self.parameters)
+
+        # the full system is in a pure state, which is only checked on default.qubit
+        wires_list = [
+            (wires, is_partial)
+            for wires, is_partial in self.wires_list
+            if is_partial or device == "default.qubit"
+        ]
+
+        purities = []
+        for wires, _ in wires_list:
+            # qml.math.purity does not support broadcasted states, so the broadcasted tape
+            # is split into one tape per parameter; these are still separate executions,
+            # submitted to the device in a single batch
+            @qml.transforms.broadcast_expand
+            @qml.qnode(dev)
+            def circuit(x):
+                qml.IsingXX(x, wires=[0, 1])
+                return qml.purity(wires=wires)  # pylint: disable=cell-var-from-loop
+
+            purities.append(circuit(params))
+
+        purities = qml.math.stack(purities)
+        is_partial = np.array([[subsystem_is_partial] for _, subsystem_is_partial in wires_list])
+        expected_purities = np.where(
+            is_partial, expected_purity_ising_xx(params), np.ones_like(params)
+        )
+
+        assert qml.math.shape(purities) == (len(wires_list), len(params))
+        assert qml.math.allclose(purities, expected_purities)
+
+    @pytest.mark.thorough
+    @pytest.mark.parametrize("device", devices)
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
-    def test_IsingXX_qnode_purity(self, device, param, wires, is_partial):
-        """Tests purity for a qnode"""
+    def test_IsingXX_qnode_purity(self, device, param, wires, is_partial, device_cache):
+        """Tests purity for a qnode, one parameter and subsystem at a time"""
 
-        dev = qml.device(device, wires=2)
+        if not is_partial and device != "default.qubit":
+            pytest.skip("pure-state identity covered by default.qubit run")
+
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev)
         def circuit(x):
@@ -82,185 +201,274 @@ class TestPurity:
         expected_purity = expected_purity_ising_xx(param) if is_partial else 1
         assert qml.math.allclose(purity, expected_purity)
 
+    @pytest.mark.parametrize("device", mix_supported_devices)
+    def test_bit_flip_qnode_purity_batched(self, device, device_cache):
+        """Tests purity on a noisy device with bit flips for all probabilities and
+        subsystems at once"""
+
+        dev = get_device(device_cache, device, 2)
+
+        # channels do not support parameter broadcasting, so the circuits for all
+        # probabilities and subsystems are executed as a single batch instead
+        tapes = []
+        for wires, _ in self.wires_list:
+            for p in self.probs:
+                with qml.tape.QuantumTape() as tape:
+                    bit_flip_circuit(p, wires)
+
+                tapes.append(tape)
+
+        purities = qml.math.reshape(
+            qml.execute(tapes, dev, None), (len(self.wires_list), len(self.probs))
+        )
+        is_partial = np.array(
+            [[subsystem_is_partial] for _, subsystem_is_partial in self.wires_list]
+        )
+        expected_purities = np.where(is_partial, 0.5, self.bit_flip_purities)
+        assert qml.math.allclose(purities, expected_purities)
+
+    @pytest.mark.thorough
     @pytest.mark.parametrize("device", mix_supported_devices)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
-    @pytest.mark.parametrize("param", probs)
-    def test_bit_flip_qnode_purity(self, device, wires, param, is_partial):
+    @pytest.mark.parametrize(
+        "param, full_purity", list(zip(probs, bit_flip_purities)), ids=prob_ids
+    )
+    def test_bit_flip_qnode_purity(
+        self, device, wires, param, full_purity, is_partial, device_cache
+    ):
         """Tests purity for a qnode on a noisy device with bit flips"""
 
-        dev = qml.device(device, wires=2)
-
-        @qml.qnode(dev)
-        def circuit(p):
-            qml.Hadamard(wires=0)
-            qml.CNOT(wires=[0, 1])
-            qml.BitFlip(p, wires=0)
-            qml.BitFlip(p, wires=1)
-            return qml.purity(wires=wires)
+        dev = get_device(device_cache, device, 2)
+        circuit = qml.QNode(partial(bit_flip_circuit, wires=wires), dev)
 
         purity = circuit(param)
-        expected_purity = (
-            0.5
-            if is_partial
-            else 4 * (0.5 - (1 - param) * param) ** 2 + 4 * (1 - param) ** 2 * param**2
-        )
+        expected_purity = 0.5 if is_partial else full_purity
         assert qml.math.allclose(purity, expected_purity)
 
     @pytest.mark.parametrize("device", grad_supported_devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
     @pytest.mark.parametrize("diff_method", diff_methods)
-    def test_IsingXX_qnode_purity_grad(self, device, param, wires, is_partial, diff_method):
+    def test_IsingXX_qnode_purity_grad(
+        self, device, param, wires, is_partial, diff_method, device_cache
+    ):
         """Tests purity for a qnode"""
 
-        dev = qml.device(device, wires=2)
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev, diff_method=diff_method)
         def circuit(x):
             qml.IsingXX(x, wires=[0, 1])
             return qml.purity(wires=wires)
 
-        grad_purity = qml.grad(circuit)(param)
+        grad_purity = qml.grad(circuit)(qml.numpy.array(param, requires_grad=True))
         expected_grad = expected_purity_grad_ising_xx(param) if is_partial else 0
         assert qml.math.allclose(grad_purity, expected_grad, rtol=1e-04, atol=1e-05)
 
     @pytest.mark.parametrize("device", mix_supported_devices)
-    @pytest.mark.parametrize("wires,is_partial", wires_list)
-    @pytest.mark.parametrize("param", probs)
+    @pytest.mark.parametrize("param", probs, ids=prob_ids)
     @pytest.mark.parametrize("diff_method", diff_methods)
-    def test_bit_flip_qnode_purity_grad(self, device, wires, param, is_partial, diff_method):
-        """Tests gradient of purity for a qnode on a noisy device with bit flips"""
+    def test_bit_flip_qnode_purity_grad(self, device, param, diff_method, device_cache):
+        """Tests gradient of purity for a qnode on a noisy device with bit flips. Only the
+        full system is considered, since the reduced states are maximally mixed for any
+        probability, so that their purity is constant."""
 
-        dev = qml.device(device, wires=2)
+        dev = get_device(device_cache, device, 2)
 
-        @qml.qnode(dev)
-        def circuit(p):
-            qml.Hadamard(wires=0)
-            qml.CNOT(wires=[0, 1])
-            qml.BitFlip(p, wires=0)
-            qml.BitFlip(p, wires=1)
-            return qml.purity(wires=wires)
+        circuit = qml.QNode(partial(bit_flip_circuit, wires=[0, 1]), dev, diff_method=diff_method)
 
-        purity_grad = qml.grad(circuit)(param)
-        expected_purity_grad = 0 if is_partial else 32 * (param - 0.5) ** 3
+        purity_grad = qml.grad(circuit)(qml.numpy.array(param, requires_grad=True))
+        expected_purity_grad = 32 * (param - 0.5) ** 3
         assert qml.math.allclose(purity_grad, expected_purity_grad, rtol=1e-04, atol=1e-05)
 
     @pytest.mark.jax
+    @pytest.mark.xdist_group(name="jax")
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param_idx", parameter_indices, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
-    def test_IsingXX_qnode_purity_jax(self, device, param, wires, is_partial):
+    def test_IsingXX_qnode_purity_jax(
+        self, device, param_idx, wires, is_partial, device_cache, jnp_params
+    ):
         """Test purity for a QNode with jax interface."""
 
-        import jax.numpy as jnp
+        if not is_partial and device != "default.qubit":
+            pytest.skip("pure-state identity covered by default.qubit run")
 
-        dev = qml.device(device, wires=2)
+        param = self.parameters[param_idx]
+
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev, interface="jax")
         def circuit(x):
             qml.IsingXX(x, wires=[0, 1])
             return qml.purity(wires=wires)
 
-        purity = circuit(jnp.array(param))
+        purity = circuit(jnp_params[param_idx])
         expected_purity = expected_purity_ising_xx(param) if is_partial else 1
         assert qml.math.allclose(purity, expected_purity)
 
     @pytest.mark.jax
+    @pytest.mark.xdist_group(name="jax")
     @pytest.mark.parametrize("device", grad_supported_devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param_idx", parameter_indices, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
     @pytest.mark.parametrize("diff_method", diff_methods)
-    def test_IsingXX_qnode_purity_grad_jax(self, device, param, wires, is_partial, diff_method):
+    def test_IsingXX_qnode_purity_grad_jax(
+        self,
+        device,
+        param_idx,
+        wires,
+        is_partial,
+        diff_method,
+        device_cache,
+        jnp_params,
+        jax_grad_fn_cache,
+    ):
         """Test purity for a QNode gradient with Jax."""
 
         import jax
 
-        dev = qml.device(device, wires=2)
+        param = self.parameters[param_idx]
 
-        @qml.qnode(dev, interface="jax", diff_method=diff_method)
-        def circuit(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.purity(wires=wires)
+        key = (device, diff_method, tuple(wires))
+        grad_fn = jax_grad_fn_cache.get(key)
+
+        if grad_fn is None:
+            dev = get_device(device_cache, device, 2)
+
+            @qml.qnode(dev, interface="jax", diff_method=diff_method)
+            def circuit(x):
+                qml.IsingXX(x, wires=[0, 1])
+                return qml.purity(wires=wires)
+
+            grad_fn = jax.grad(circuit)
+            jax_grad_fn_cache[key] = grad_fn
 
-        grad_purity = jax.grad(circuit)(jax.numpy.array(param))
+        grad_purity = grad_fn(jnp_params[param_idx])
         grad_expected_purity = expected_purity_grad_ising_xx(param) if is_partial else 0
 
         assert qml.math.allclose(grad_purity, grad_expected_purity, rtol=1e-04, atol=1e-05)
 
     @pytest.mark.jax
+    @pytest.mark.xdist_group(name="jax")
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param_idx", parameter_indices, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
-    def test_IsingXX_qnode_purity_jax_jit(self, device, param, wires, is_partial):
+    def test_IsingXX_qnode_purity_jax_jit(
+        self, device, param_idx, wires, is_partial, device_cache, jit_circuit_cache, jnp_params
+    ):
         """Test purity for a QNode with jax interface."""
 
+        if not is_partial and device != "default.qubit":
+            pytest.skip("pure-state identity covered by default.qubit run")
+
         import jax
-        import jax.numpy as jnp
 
-        dev = qml.device(device, wires=2)
+        param = self.parameters[param_idx]
 
-        @qml.qnode(dev, interface="jax-jit")
-        def circuit(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.purity(wires=wires)
+        key = ("purity", device, tuple(wires), "best")
+        jit_fn = jit_circuit_cache.get(key)
+
+        if jit_fn is None:
+            dev = get_device(device_cache, device, 2)
 
-        purity = jax.jit(circuit)(jnp.array(param))
+            @qml.qnode(dev, interface="jax-jit")
+            def circuit(x):
+                qml.IsingXX(x, wires=[0, 1])
+                return qml.purity(wires=wires)
+
+            jit_fn = jax.jit(circuit)
+            jit_circuit_cache[key] = jit_fn
+
+        purity = jit_fn(jnp_params[param_idx])
         expected_purity = expected_purity_ising_xx(param) if is_partial else 1
         assert qml.math.allclose(purity, expected_purity)
 
     @pytest.mark.jax
+    @pytest.mark.xdist_group(name="jax")
     @pytest.mark.parametrize("device", grad_supported_devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param_idx", parameter_indices, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
     @pytest.mark.parametrize("diff_method", diff_methods)
-    def test_IsingXX_qnode_purity_grad_jax_jit(self, device, param, wires, is_partial, diff_method):
+    def test_IsingXX_qnode_purity_grad_jax_jit(
+        self,
+        device,
+        param_idx,
+        wires,
+        is_partial,
+        diff_method,
+        device_cache,
+        jit_circuit_cache,
+        jnp_params,
+    ):
         """Test purity for a QNode gradient with Jax."""
 
         import jax
 
-        dev = qml.device(device, wires=2)
+        param = self.parameters[param_idx]
 
-        @qml.qnode(dev, interface="jax-jit", diff_method=diff_method)
-        def circuit(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.purity(wires=wires)
+        key = ("grad", device, tuple(wires), diff_method)
+        jit_grad_fn = jit_circuit_cache.get(key)
 
-        grad_purity = jax.jit(jax.grad(circuit))(jax.numpy.array(param))
+        if jit_grad_fn is None:
+            dev = get_device(device_cache, device, 2)
+
+            @qml.qnode(dev, interface="jax-jit", diff_method=diff_method)
+            def circuit(x):
+                qml.IsingXX(x, wires=[0, 1])
+                return qml.purity(wires=wires)
+
+            jit_grad_fn = jax.jit(jax.grad(circuit))
+            jit_circuit_cache[key] = jit_grad_fn
+
+        grad_purity = jit_grad_fn(jnp_params[param_idx])
         grad_expected_purity = expected_purity_grad_ising_xx(param) if is_partial else 0
 
         assert qml.math.allclose(grad_purity, grad_expected_purity, rtol=1e-04, atol=1e-05)
 
     @pytest.mark.torch
+    @pytest.mark.xdist_group(name="torch")
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
-    def test_IsingXX_qnode_purity_torch(self, device, param, wires, is_partial):
+    def test_IsingXX_qnode_purity_torch(
+        self, device, param, wires, is_partial, device_cache, torch_param
+    ):
         """Tests purity for a qnode"""
 
+        if not is_partial and device != "default.qubit":
+            pytest.skip("pure-state identity covered by default.qubit run")
+
         import torch
 
-        dev = qml.device(device, wires=2)
+        with torch.no_grad():
+            torch_param.fill_(param)
+
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev, interface="torch")
         def circuit(x):
             qml.IsingXX(x, wires=[0, 1])
             return qml.purity(wires=wires)
 
-        purity = circuit(torch.tensor(param))
+        purity = circuit(torch_param)
         expected_purity = expected_purity_ising_xx(param) if is_partial else 1
         assert qml.math.allclose(purity, expected_purity)
 
     @pytest.mark.torch
+    @pytest.mark.xdist_group(name="torch")
     @pytest.mark.parametrize("device", grad_supported_devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
     @pytest.mark.parametrize("diff_method", diff_methods)
-    def test_IsingXX_qnode_purity_grad_torch(self, device, param, wires, is_partial, diff_method):
+    def test_IsingXX_qnode_purity_grad_torch(
+        self, device, param, wires, is_partial, diff_method, device_cache, torch_param
+    ):
         """Test purity for a QNode gradient with torch."""
 
         import torch
 
-        dev = qml.device(device, wires=2)
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev, interface="torch", diff_method=diff_method)
         def circuit(x):
@@ -269,44 +477,56 @@ class TestPurity:
 
         expected_grad = expected_purity_grad_ising_xx(param) if is_partial else 0
 
-        param = torch.tensor(param, dtype=torch.float64, requires_grad=True)
-        purity = circuit(param)
+        with torch.no_grad():
+            torch_param.fill_(param)
+        torch_param.grad = None
+
+        purity = circuit(torch_param)
         purity.backward()
-        grad_purity = param.grad
+        grad_purity = torch_param.grad
 
         assert qml.math.allclose(grad_purity, expected_grad, rtol=1e-04, atol=1e-05)
 
     @pytest.mark.tf
+    @pytest.mark.xdist_group(name="tf")
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
-    def test_IsingXX_qnode_purity_tf(self, device, param, wires, is_partial):
+    def test_IsingXX_qnode_purity_tf(
+        self, device, param, wires, is_partial, device_cache, tf_param
+    ):
         """Tests purity for a qnode"""
 
-        import tensorflow as tf
+        if not is_partial and device != "default.qubit":
+            pytest.skip("pure-state identity covered by default.qubit run")
+
+        tf_param.assign(param)
 
-        dev = qml.device(device, wires=2)
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev, interface="tf")
         def circuit(x):
             qml.IsingXX(x, wires=[0, 1])
             return qml.purity(wires=wires)
 
-        purity = circuit(tf.Variable(param))
+        purity = circuit(tf_param)
         expected_purity = expected_purity_ising_xx(param) if is_partial else 1
         assert qml.math.allclose(purity, expected_purity)
 
     @pytest.mark.tf
+    @pytest.mark.xdist_group(name="tf")
     @pytest.mark.parametrize("device", grad_supported_devices)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
     @pytest.mark.parametrize("wires,is_partial", wires_list)
     @pytest.mark.parametrize("diff_method", diff_methods)
-    def test_IsingXX_qnode_purity_grad_tf(self, device, param, wires, is_partial, diff_method):
+    def test_IsingXX_qnode_purity_grad_tf(
+        self, device, param, wires, is_partial, diff_method, device_cache, tf_param
+    ):
         """Test purity for a QNode gradient with tf."""
 
         import tensorflow as tf
 
-        dev = qml.device(device, wires=2)
+        dev = get_device(device_cache, device, 2)
 
         @qml.qnode(dev, interface="tf", diff_method=diff_method)
         def circuit(x):
@@ -315,20 +535,20 @@ class TestPurity:
 
         grad_expected_purity = expected_purity_grad_ising_xx(param) if is_partial else 0
 
-        param = tf.Variable(param)
+        tf_param.assign(param)
         with tf.GradientTape() as tape:
-            purity = circuit(param)
+            purity = circuit(tf_param)
 
-        grad_purity = tape.gradient(purity, param)
+        grad_purity = tape.gradient(purity, tf_param)
 
         assert qml.math.allclose(grad_purity, grad_expected_purity, rtol=1e-04, atol=1e-05)
 
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("param", parameters)
-    def test_qnode_entropy_custom_wires(self, device, param):
+    @pytest.mark.parametrize("param", parameters, ids=parameter_ids)
+    def test_qnode_entropy_custom_wires(self, device, param, device_cache):
         """Test that purity can be returned with custom wires."""
 
-        dev = qml.device(device, wires=["a", 1])
+        dev = get_device(device_cache, device, ["a", 1])
 
         @qml.qnode(dev)
         def circuit(x):
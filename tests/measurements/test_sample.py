@@ -19,47 +19,100 @@ import pennylane as qml
 from pennylane.measurements import Sample
 from pennylane.operation import EigvalsUndefinedError, Operator
 
+_HERM_INT = qml.Hermitian(np.diag([1, 2]), 0)
+_HERM_FLT = qml.Hermitian(np.diag([1.0, 2.0]), 0)
+_PROJ_Z = qml.Projector([0, 1], wires=[0, 1]) @ qml.PauliZ(2)
+_HERM_Z = qml.Hermitian(np.array(np.eye(2)), wires=[0]) @ qml.PauliZ(2)
+_PROJ_HERM = qml.Projector([0, 1], wires=[0, 1]) @ qml.Hermitian(np.array(np.eye(2)), wires=[2])
+
 
 # TODO: Remove this when new CustomMP are the default
 def custom_measurement_process(device, spy):
     assert len(spy.call_args_list) > 0  # make sure method is mocked properly
 
     samples = device._samples
+    wire_order = device.wires
     call_args_list = list(spy.call_args_list)
+
+    # calls sampling the same measurement over the same shots yield the same samples,
+    # hence they only need to be checked once
+    seen = set()
+    expected, results = [], []
     for call_args in call_args_list:
         meas = call_args.args[1]
         shot_range, bin_size = (call_args.kwargs["shot_range"], call_args.kwargs["bin_size"])
+        key = (id(meas), None if shot_range is None else tuple(shot_range), bin_size)
+        if key in seen:
+            continue
+        seen.add(key)
+
         if isinstance(meas, Operator):
             meas = qml.sample(op=meas)
-        assert qml.math.allequal(
-            device.sample(call_args.args[1], **call_args.kwargs),
+        expected.append(device.sample(call_args.args[1], **call_args.kwargs))
+        results.append(
             meas.process_samples(
                 samples=samples,
-                wire_order=device.wires,
+                wire_order=wire_order,
                 shot_range=shot_range,
                 bin_size=bin_size,
-            ),
+            )
         )
 
+    # samples of different shot ranges may differ in shape, hence the shapes are
+    # compared separately and all the values are compared at once
+    assert [np.shape(res) for res in expected] == [np.shape(res) for res in results]
+    assert np.array_equal(
+        np.concatenate([np.ravel(res) for res in expected]),
+        np.concatenate([np.ravel(res) for res in results]),
+    )
+
+
+@pytest.fixture(scope="class")
+def device_factory():
+    """Returns a function creating ``default.qubit`` devices, which are cached
+    by their number of wires and shots."""
+    cache = {}
+
+    def make(wires, shots=None):
+        key = (wires, tuple(shots) if isinstance(shots, list) else shots)
+        if key not in cache:
+            cache[key] = qml.device("default.qubit", wires=wires, shots=shots)
+        return cache[key]
+
+    return make
+
 
 class TestSample:
     """Tests for the sample function"""
 
-    def test_sample_dimension(self, mocker):
-        """Test that the sample function outputs samples of the right size"""
-        n_sample = 10
+    n_sample = 10
 
-        dev = qml.device("default.qubit", wires=2, shots=n_sample)
+    @pytest.mark.parametrize(
+        "n_wires, ops_fn, expected_shape",
+        [
+            (2, lambda: (qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliX(1))), (2, n_sample)),
+            (1, lambda: qml.sample(qml.PauliZ(0)), (n_sample,)),
+            (3, lambda: tuple(qml.sample(qml.PauliZ(i)) for i in range(3)), (3, n_sample)),
+        ],
+        ids=["two_wires", "single_wire", "three_wires"],
+    )
+    def test_sample_dimension(self, mocker, n_wires, ops_fn, expected_shape):
+        """Test that the sample function outputs samples of the right size and type,
+        both for a single wire and for multiple wires where a rectangular array is expected"""
+        dev = qml.device("default.qubit", wires=n_wires, shots=self.n_sample)
         spy = mocker.spy(qml.QubitDevice, "sample")
 
         @qml.qnode(dev)
         def circuit():
             qml.RX(0.54, wires=0)
-            return qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliX(1))
+            return ops_fn()
 
-        sample = circuit()
+        result = circuit()
 
-        assert np.array_equal(sample.shape, (2, n_sample))
+        # If all the dimensions are equal the result will end up to be a proper rectangular array
+        assert isinstance(result, np.ndarray)
+        assert np.array_equal(result.shape, expected_shape)
+        assert result.dtype == np.dtype("int")
 
         custom_measurement_process(dev, spy)
 
@@ -86,47 +139,6 @@ class TestSample:
 
         custom_measurement_process(dev, spy)
 
-    def test_single_wire_sample(self, mocker):
-        """Test the return type and shape of sampling a single wire"""
-        n_sample = 10
-
-        dev = qml.device("default.qubit", wires=1, shots=n_sample)
-        spy = mocker.spy(qml.QubitDevice, "sample")
-
-        @qml.qnode(dev)
-        def circuit():
-            qml.RX(0.54, wires=0)
-
-            return qml.sample(qml.PauliZ(0))
-
-        result = circuit()
-
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result.shape, (n_sample,))
-
-        custom_measurement_process(dev, spy)
-
-    def test_multi_wire_sample_regular_shape(self, mocker):
-        """Test the return type and shape of sampling multiple wires
-        where a rectangular array is expected"""
-        n_sample = 10
-
-        dev = qml.device("default.qubit", wires=3, shots=n_sample)
-        spy = mocker.spy(qml.QubitDevice, "sample")
-
-        @qml.qnode(dev)
-        def circuit():
-            return qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliZ(1)), qml.sample(qml.PauliZ(2))
-
-        result = circuit()
-
-        # If all the dimensions are equal the result will end up to be a proper rectangular array
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result.shape, (3, n_sample))
-        assert result.dtype == np.dtype("int")
-
-        custom_measurement_process(dev, spy)
-
     @pytest.mark.filterwarnings("ignore:Creating an ndarray from ragged nested sequences")
     def test_sample_output_type_in_combination(self, mocker):
         """Test the return type and shape of sampling multiple works
@@ -278,8 +290,8 @@ class TestSample:
             (qml.PauliZ(0), int),
             (qml.Hadamard(0), int),
             (qml.Identity(0), int),
-            (qml.Hermitian(np.diag([1, 2]), 0), float),
-            (qml.Hermitian(np.diag([1.0, 2.0]), 0), float),
+            (_HERM_INT, float),
+            (_HERM_FLT, float),
             # Tensor product observables
             (
                 qml.PauliX("c")
@@ -289,12 +301,9 @@ class TestSample:
                 @ qml.Identity("b"),
                 int,
             ),
-            (qml.Projector([0, 1], wires=[0, 1]) @ qml.PauliZ(2), float),
-            (qml.Hermitian(np.array(np.eye(2)), wires=[0]) @ qml.PauliZ(2), float),
-            (
-                qml.Projector([0, 1], wires=[0, 1]) @ qml.Hermitian(np.array(np.eye(2)), wires=[2]),
-                float,
-            ),
+            (_PROJ_Z, float),
+            (_HERM_Z, float),
+            (_PROJ_HERM, float),
         ],
     )
     def test_numeric_type(self, obs, exp):
@@ -307,26 +316,26 @@ class TestSample:
         [
             None,
             qml.PauliZ(0),
-            qml.Hermitian(np.diag([1, 2]), 0),
-            qml.Hermitian(np.diag([1.0, 2.0]), 0),
+            _HERM_INT,
+            _HERM_FLT,
         ],
     )
-    def test_shape(self, obs):
+    def test_shape(self, obs, device_factory):
         """Test that the shape is correct."""
         shots = 10
-        dev = qml.device("default.qubit", wires=3, shots=shots)
+        dev = device_factory(3, shots)
         res = qml.sample(obs) if obs is not None else qml.sample()
         expected = (1, shots) if obs is not None else (1, shots, 3)
         assert res.shape(dev) == expected
 
     @pytest.mark.parametrize(
         "obs",
-        [qml.PauliZ(0), qml.Hermitian(np.diag([1, 2]), 0), qml.Hermitian(np.diag([1.0, 2.0]), 0)],
+        [qml.PauliZ(0), _HERM_INT, _HERM_FLT],
     )
-    def test_shape_shot_vector(self, obs):
+    def test_shape_shot_vector(self, obs, device_factory):
         """Test that the shape is correct with the shot vector too."""
         shot_vector = (1, 2, 3)
-        dev = qml.device("default.qubit", wires=3, shots=shot_vector)
+        dev = device_factory(3, shot_vector)
         res = qml.sample(obs)
         expected = ((), (2,), (3,))
         assert res.shape(dev) == expected